@@ -1,16 +1,33 @@
 import streamlit as st
 import requests
-import json
+from http.cookiejar import DefaultCookiePolicy
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+import orjson
 import io
-import PyPDF2
-import docx
+import csv
+import numpy as np
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from collections import Counter, namedtuple
 from datetime import datetime, timedelta
+from functools import lru_cache
 import logging
+import math
 import hashlib
+import html
 import time
 import re
+import threading
+import zipfile
 from urllib.parse import urlparse
 
+# pypdfium2 (PDFium bindings, permissively licensed) extracts PDF text much faster
+# than PyPDF2, which stays as a fallback for platforms without a pypdfium2 wheel
+try:
+    import pypdfium2 as pdfium
+except ImportError:
+    pdfium = None
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -27,6 +44,44 @@ st.set_page_config(
 EURI_API_URL = "https://api.euron.one/api/v1/euri/chat/completions"
 SERPAPI_URL = "https://serpapi.com/search"
 
+# Shared connection pool so EURI and SerpAPI calls reuse keep-alive connections;
+# cached as a resource because Streamlit re-executes this module on every rerun
+HTTP_POOL_SIZE = 16
+
+# Connecting should be quick; read budgets are set per call since model latency varies
+HTTP_CONNECT_TIMEOUT_SECONDS = 5
+
+@st.cache_resource(show_spinner=False)
+def create_http_adapter():
+    """Create the process-wide pooled HTTP adapter with retries for transient HTTP errors."""
+    retry = Retry(
+        total=3,
+        connect=3,
+        read=0,  # A read timeout usually means the model is still working; don't resend
+        backoff_factor=0.5,
+        status_forcelist=[429, 500, 502, 503, 504],
+        # Retry-After on a 429/503 can ask for any wait; keep our own short backoff
+        # so the timeouts, not the server, bound how long a search can stall
+        respect_retry_after_header=False
+    )
+    return HTTPAdapter(pool_connections=HTTP_POOL_SIZE, pool_maxsize=HTTP_POOL_SIZE, max_retries=retry)
+
+# Sessions aren't shared: each thread gets its own, and none of them keep cookies,
+# so no state leaks between users or search worker threads
+_HTTP_LOCAL = threading.local()
+
+def get_http_session():
+    """Return this thread's cookie-less requests session on the shared connection pool."""
+    session = getattr(_HTTP_LOCAL, 'session', None)
+    if session is None:
+        session = requests.Session()
+        session.cookies.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+        adapter = create_http_adapter()
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        _HTTP_LOCAL.session = session
+    return session
+
 # Securely fetch API keys from Streamlit Secrets
 try:
     EURI_API_KEY = st.secrets["EURI_API_KEY"]
@@ -37,16 +92,16 @@ except (KeyError, FileNotFoundError):
     st.stop()
 
 # --- Session State Initialization ---
-if 'resume_data' not in st.session_state:
-    st.session_state.resume_data = None
-if 'resume_insights' not in st.session_state:
-    st.session_state.resume_insights = None
-if 'scraped_jobs' not in st.session_state:
-    st.session_state.scraped_jobs = []
-if 'ai_jobs' not in st.session_state:
-    st.session_state.ai_jobs = []
-if 'chat_messages' not in st.session_state:
-    st.session_state.chat_messages = []
+# The literal is rebuilt each run, so sessions never share the mutable defaults
+for key, default in {
+    'resume_data': None,
+    'resume_insights': None,
+    'scraped_jobs': [],
+    'ai_jobs': [],
+    'chat_messages': [],
+    'search_cache': {}
+}.items():
+    st.session_state.setdefault(key, default)
 
 # --- Enhanced Constants ---
 TIME_FILTERS = {
@@ -101,7 +156,7 @@ COUNTRIES = {
     }
 }
 
-INDUSTRIES = {
+INDUSTRY_DEFINITIONS = {
     "Technology": {
         "domains": ["Software Engineering", "Data Science & Analytics", "DevOps & Cloud", "Cybersecurity", 
                    "AI/Machine Learning", "Mobile Development", "Web Development", "Product Management"],
@@ -132,28 +187,154 @@ INDUSTRIES = {
     }
 }
 
+# Frozen per-industry lookups and prompt fragments, built once at import.
+# Keyword matchers list longest keywords first so a match like "healthcare"
+# also accounts for its prefix "health".
+Industry = namedtuple('Industry', ['domains', 'keywords', 'keyword_re', 'domains_prompt', 'keywords_prompt'])
+
+INDUSTRIES = {
+    name: Industry(
+        domains=tuple(info['domains']),
+        keywords=tuple(info['keywords']),
+        keyword_re=re.compile('|'.join(
+            re.escape(kw) for kw in sorted(info['keywords'], key=len, reverse=True)
+        )),
+        domains_prompt=', '.join(info['domains'][:5]),
+        keywords_prompt=', '.join(info['keywords'][:8])
+    )
+    for name, info in INDUSTRY_DEFINITIONS.items()
+}
+
+# Number of job cards rendered per results page
+JOBS_PER_PAGE = 20
+
+# --- Precompiled Search Result Matchers ---
+def _compile_alternation(terms):
+    """Compile substring terms into a single alternation regex."""
+    return re.compile('|'.join(re.escape(term) for term in terms))
+
+# Job site indicators
+JOB_SITE_INDICATORS = (
+    'linkedin.com/jobs', 'indeed.', 'glassdoor.', 'monster.',
+    'greenhouse.io', 'lever.co', 'workday.', 'bamboohr.',
+    'smartrecruiters.', 'jobvite.', '/careers', '/jobs'
+)
+
+# Job content indicators
+JOB_CONTENT_INDICATORS = (
+    'job', 'career', 'position', 'hiring', 'vacancy', 
+    'employment', 'opportunity', 'apply', 'recruit', 'opening'
+)
+
+# Links that are never job postings
+JOB_EXCLUDE_TERMS = ('wikipedia', 'linkedin.com/in/', 'facebook.com', 'twitter.com', 'youtube.com')
+
+# URL indicator -> source name, checked in priority order (first match wins)
+JOB_SOURCE_INDICATORS = (
+    ('linkedin.com/jobs', 'LinkedIn'),
+    ('indeed.', 'Indeed'),
+    ('glassdoor.', 'Glassdoor'),
+    ('monster.', 'Monster'),
+    ('greenhouse.io', 'Greenhouse'),
+    ('lever.co', 'Lever'),
+    ('workday.', 'Workday'),
+    ('bamboohr.', 'BambooHR'),
+    ('smartrecruiters.', 'SmartRecruiters'),
+    ('jobvite.', 'Jobvite'),
+    ('greenhouse.', 'Greenhouse'),
+    ('/careers', 'Company Career Page'),
+    ('/jobs', 'Company Jobs Page')
+)
+
+JOB_SITE_RE = _compile_alternation(JOB_SITE_INDICATORS)
+JOB_INDICATOR_RE = _compile_alternation(JOB_CONTENT_INDICATORS)
+JOB_SNIPPET_INDICATOR_RE = _compile_alternation(JOB_CONTENT_INDICATORS[:5])
+JOB_EXCLUDE_RE = _compile_alternation(JOB_EXCLUDE_TERMS)
+
 # --- Utility Functions ---
+def extract_pdf_text(file_bytes):
+    """Extracts text from PDF bytes with pypdfium2, falling back to PyPDF2."""
+    if pdfium is not None:
+        pdf_doc = pdfium.PdfDocument(file_bytes)
+        try:
+            page_texts = (page.get_textpage().get_text_range() for page in pdf_doc)
+            return "\n".join(page_texts).replace("\r\n", "\n")
+        finally:
+            pdf_doc.close()
+    
+    import PyPDF2  # Deferred so startup doesn't pay for the fallback backend
+    
+    pdf_reader = PyPDF2.PdfReader(io.BytesIO(file_bytes))
+    page_texts = (page.extract_text() for page in pdf_reader.pages)
+    return "\n".join(page_text for page_text in page_texts if page_text)
+
+# Text runs (<w:t>), in-run tabs and line breaks (<w:tab/>, <w:br/>, <w:cr/>) and
+# paragraph starts and ends in a DOCX main document part; tab stops
+# (<w:tab w:val=...>) and empty self-closing paragraphs (<w:p/>) are skipped
+DOCX_TEXT_TOKEN_RE = re.compile(
+    r'<w:t(?:\s[^>]*)?>([^<]*)</w:t>|<w:tab\s*/>|<w:(?:br|cr)\b[^>]*/>|<w:p(?:\s[^>]*)?(?<!/)>|</w:p>'
+)
+
+# Legacy copies of markup-compatibility content; Word writes text boxes under
+# both mc:Choice and mc:Fallback, so the fallback copy would duplicate their text
+DOCX_FALLBACK_RE = re.compile(
+    r'<mc:Fallback(?:\s[^>]*)?/>|<mc:Fallback(?:\s[^>]*)?>.*?</mc:Fallback>',
+    re.DOTALL
+)
+
+def extract_docx_text(file_bytes):
+    """Extract paragraph text from DOCX bytes by scanning word/document.xml directly."""
+    with zipfile.ZipFile(io.BytesIO(file_bytes)) as archive:
+        try:
+            document_xml = archive.read('word/document.xml').decode('utf-8')
+        except KeyError:
+            # Non-standard part name; let python-docx resolve it via relationships
+            import docx  # Deferred; python-docx is only needed for this rare case
+            
+            document = docx.Document(io.BytesIO(file_bytes))
+            return "\n".join(para.text for para in document.paragraphs if para.text.strip())
+    
+    document_xml = DOCX_FALLBACK_RE.sub('', document_xml)
+    
+    paragraphs = []
+    runs = []
+    # Each open paragraph keeps its own run buffer and output slot, so a text-box
+    # paragraph nested inside another lands after its anchor instead of merging with it
+    open_paragraphs = []
+    for match in DOCX_TEXT_TOKEN_RE.finditer(document_xml):
+        run_text = match.group(1)
+        if run_text is not None:
+            runs.append(run_text)
+            continue
+        token = match.group(0)
+        if token.startswith('<w:p'):
+            open_paragraphs.append((runs, len(paragraphs)))
+            runs = []
+            continue
+        if token != '</w:p>':
+            runs.append('\t' if token.startswith('<w:tab') else '\n')
+            continue
+        outer_runs, position = open_paragraphs.pop() if open_paragraphs else ([], len(paragraphs))
+        paragraph = html.unescape("".join(runs))
+        if paragraph.strip():
+            paragraphs.insert(position, paragraph)
+        runs = outer_runs
+    return "\n".join(paragraphs)
+
 def get_text_from_file(uploaded_file):
     """Extracts text content from uploaded file (PDF, DOCX, TXT)."""
     text = ""
     try:
-        file_stream = io.BytesIO(uploaded_file.getvalue())
+        file_bytes = uploaded_file.getvalue()
         
         if uploaded_file.type == "application/pdf":
-            pdf_reader = PyPDF2.PdfReader(file_stream)
-            for page in pdf_reader.pages:
-                extracted_text = page.extract_text()
-                if extracted_text:
-                    text += extracted_text + "\n"
+            text = extract_pdf_text(file_bytes)
                     
         elif uploaded_file.type == "application/vnd.openxmlformats-officedocument.wordprocessingml.document":
-            document = docx.Document(file_stream)
-            for para in document.paragraphs:
-                if para.text.strip():
-                    text += para.text + "\n"
+            text = extract_docx_text(file_bytes)
                     
         elif uploaded_file.type == "text/plain":
-            text = str(uploaded_file.getvalue(), "utf-8")
+            text = file_bytes.decode("utf-8", errors="replace")
             
         return text.strip()
     except Exception as e:
@@ -161,21 +342,31 @@ def get_text_from_file(uploaded_file):
         st.error(f"Error reading file: {e}")
         return None
 
+# Reasoning blocks some models emit before their answer
+THINK_TAG_RE = re.compile(r'<(think|thinking)>.*?</\1>', re.DOTALL)
+
 def extract_json_from_response(text):
     """Safely extracts a JSON object from a string with enhanced error handling."""
+    json_start = 0
     try:
-        # Remove markdown code blocks
-        text = text.replace('```json', '').replace('```', '').strip()
+        # Remove thinking tags that some AI models include; the stop sequences
+        # usually keep them out, so skip the regex pass when none are present
+        if '<think' in text:
+            text = THINK_TAG_RE.sub('', text)
         
-        # Remove thinking tags that some AI models include
-        text = re.sub(r'<think>.*?</think>', '', text, flags=re.DOTALL)
-        text = re.sub(r'<thinking>.*?</thinking>', '', text, flags=re.DOTALL)
-        
-        # Remove any text before the first { and after the last }
+        # Take everything from the first { to the last }; this also drops any
+        # surrounding markdown code fences
         json_start = text.find('{')
-        if json_start == -1:
+        last_brace = text.rfind('}')
+        if json_start == -1 or last_brace < json_start:
             logger.error("No JSON object found in response")
             return None
+        
+        # Fast path: the span is usually valid JSON as-is
+        try:
+            return orjson.loads(text[json_start:last_brace + 1])
+        except orjson.JSONDecodeError:
+            pass
             
         # Find the matching closing brace
         brace_count = 0
@@ -205,10 +396,10 @@ def extract_json_from_response(text):
         json_str = clean_json_string(json_str)
         
         # Validate JSON before returning
-        parsed = json.loads(json_str)
+        parsed = orjson.loads(json_str)
         return parsed
         
-    except json.JSONDecodeError as e:
+    except orjson.JSONDecodeError as e:
         logger.error(f"JSON parsing error: {e}")
         logger.error(f"Problematic JSON snippet: {text[max(0, json_start):json_start+200]}...")
         
@@ -216,7 +407,7 @@ def extract_json_from_response(text):
         try:
             fixed_json = fix_common_json_issues(text)
             if fixed_json:
-                return json.loads(fixed_json)
+                return orjson.loads(fixed_json)
         except Exception as fix_error:
             logger.error(f"JSON fix attempt failed: {fix_error}")
             
@@ -267,7 +458,7 @@ def fix_common_json_issues(text):
         json_str = clean_json_string(json_str)
         
         # Try to validate
-        json.loads(json_str)
+        orjson.loads(json_str)
         return json_str
         
     except Exception as e:
@@ -275,7 +466,23 @@ def fix_common_json_issues(text):
         return None
 
 def call_euri_api(prompt, max_retries=3):
-    """Call the EURI API with retry logic."""
+    """Call the EURI API with retry logic, reusing the response for repeated prompts."""
+    prompt_hash = hashlib.sha256(prompt.encode('utf-8')).hexdigest()
+    try:
+        return _cached_euri_completion(prompt_hash, prompt, max_retries)
+    except RuntimeError:
+        return None
+
+@st.cache_data(show_spinner=False, max_entries=256)
+def _cached_euri_completion(prompt_hash, _prompt, max_retries):
+    """Memoize successful EURI completions by prompt hash; failures raise so they aren't cached."""
+    content = request_euri_completion(_prompt, max_retries)
+    if content is None:
+        raise RuntimeError("EURI API request failed")
+    return content
+
+def request_euri_completion(prompt, max_retries=3):
+    """Send a single-message completion request to the EURI API."""
     headers = {
         "Authorization": f"Bearer {EURI_API_KEY}",
         "Content-Type": "application/json"
@@ -290,9 +497,9 @@ def call_euri_api(prompt, max_retries=3):
     
     for attempt in range(max_retries):
         try:
-            response = requests.post(EURI_API_URL, headers=headers, json=payload, timeout=90)
+            response = get_http_session().post(EURI_API_URL, headers=headers, data=orjson.dumps(payload), timeout=(HTTP_CONNECT_TIMEOUT_SECONDS, 90))
             response.raise_for_status()
-            result = response.json()
+            result = orjson.loads(response.content)
             return result['choices'][0]['message']['content']
         except Exception as e:
             logger.error(f"API Request Failed (attempt {attempt + 1}): {e}")
@@ -300,7 +507,55 @@ def call_euri_api(prompt, max_retries=3):
                 time.sleep(2 ** attempt)
     return None
 
+def stream_euri_completion(prompt):
+    """Yield EURI completion text as it arrives over the API's server-sent event stream."""
+    headers = {
+        "Authorization": f"Bearer {EURI_API_KEY}",
+        "Content-Type": "application/json"
+    }
+    
+    payload = {
+        "model": "deepseek-r1-distill-llama-70b",
+        "messages": [{"role": "user", "content": prompt}],
+        "max_tokens": 1000,
+        "temperature": 0.7,
+        "stream": True
+    }
+    
+    with get_http_session().post(EURI_API_URL, headers=headers, data=orjson.dumps(payload), timeout=(HTTP_CONNECT_TIMEOUT_SECONDS, 90), stream=True) as response:
+        response.raise_for_status()
+        for line in response.iter_lines():
+            # Events arrive as "data: {...}" lines and the stream ends with "data: [DONE]"
+            if not line.startswith(b"data:"):
+                continue
+            data = line[5:].strip()
+            if data == b"[DONE]":
+                break
+            choices = orjson.loads(data).get('choices') or []
+            if choices:
+                text = (choices[0].get('delta') or {}).get('content')
+                if text:
+                    yield text
+
 # --- SerpAPI Job Search Functions ---
+# Upper bound on concurrent SerpAPI requests per search
+SERPAPI_MAX_WORKERS = 4
+
+# Offset between the first wave of concurrent requests so they don't land at once
+SERPAPI_STAGGER_SECONDS = 0.1
+
+# How long identical searches are served from the session cache
+SEARCH_CACHE_TTL_SECONDS = 15 * 60
+
+# How long a single SerpAPI query's results are reused across searches and sessions
+SERPAPI_RESPONSE_TTL_SECONDS = 10 * 60
+
+# Longest snippet shown in a job's description expander
+SNIPPET_PREVIEW_CHARS = 600
+
+# Minimum gap between progress widget updates while queries complete
+PROGRESS_UPDATE_INTERVAL_SECONDS = 0.25
+
 def create_serpapi_queries(job_title, country, city="", industry=None, time_filter="d"):
     """Create optimized search queries for SerpAPI."""
     queries = []
@@ -314,17 +569,14 @@ def create_serpapi_queries(job_title, country, city="", industry=None, time_filt
     location_parts.append(f'"{country}"')
     location_context = " ".join(location_parts)
     
-    # Primary site-specific queries
-    for site in job_sites[:6]:  # Top 6 sites
-        queries.extend([
-            f'"{job_title}" site:{site} {location_context}',
-            f'{job_title} site:{site} {location_context} apply',
-            f'"{job_title}" site:{site} {location_context} hiring'
-        ])
+    # Primary site-specific queries (one per site first so the limit keeps them all)
+    top_sites = job_sites[:6]  # Top 6 sites
+    for site in top_sites:
+        queries.append(f'"{job_title}" site:{site} {location_context}')
     
     # Industry-specific queries
     if industry and industry in INDUSTRIES:
-        industry_keywords = INDUSTRIES[industry]['keywords'][:3]
+        industry_keywords = INDUSTRIES[industry].keywords[:3]
         for keyword in industry_keywords:
             for site in job_sites[:3]:
                 queries.append(f'"{job_title}" {keyword} site:{site} {location_context}')
@@ -337,42 +589,60 @@ def create_serpapi_queries(job_title, country, city="", industry=None, time_filt
         f'{job_title} {location_context} "we are hiring"'
     ])
     
-    return list(set(queries))[:12]  # Remove duplicates, limit to 12
+    # Secondary site-specific variants fill any remaining slots
+    for site in top_sites:
+        queries.extend([
+            f'{job_title} site:{site} {location_context} apply',
+            f'"{job_title}" site:{site} {location_context} hiring'
+        ])
+    
+    return list(dict.fromkeys(queries))[:12]  # Remove duplicates keeping order, limit to 12
+
+@st.cache_data(ttl=SERPAPI_RESPONSE_TTL_SECONDS, max_entries=256, show_spinner=False)
+def fetch_serpapi_results(query, country_code, time_filter, num_results, _start_delay=0):
+    """Fetch organic results for one SerpAPI query, cached so repeated queries skip the network."""
+    # Only stagger requests that actually go out; cache hits return immediately
+    if _start_delay:
+        time.sleep(_start_delay)
+    
+    params = {
+        'api_key': SERPAPI_KEY,
+        'engine': 'google',
+        'q': query,
+        'gl': country_code,  # Country for search results
+        'hl': 'en',  # Language
+        'num': num_results,
+        'no_cache': 'true'
+    }
+    
+    # Add time filter if specified
+    if time_filter:
+        params['tbs'] = f'qdr:{time_filter}'
+    
+    logger.info(f"SerpAPI search: {query} (country: {country_code}, time: {time_filter})")
+    
+    response = get_http_session().get(SERPAPI_URL, params=params, timeout=(HTTP_CONNECT_TIMEOUT_SECONDS, 30))
+    response.raise_for_status()
+    
+    # Decode the raw (already decompressed) bytes directly, skipping response.text
+    data = orjson.loads(response.content)
+    
+    # Raise rather than return so failed lookups are never cached
+    if 'error' in data:
+        raise RuntimeError(data['error'])
+    
+    return data.get('organic_results', [])
 
-def search_jobs_with_serpapi(query, country, time_filter="d", num_results=20):
+def search_jobs_with_serpapi(query, country, time_filter="d", num_results=20, start_delay=0):
     """Search for jobs using SerpAPI."""
     try:
         country_info = COUNTRIES.get(country, {})
         country_code = country_info.get('code', 'us')
         
-        params = {
-            'api_key': SERPAPI_KEY,
-            'engine': 'google',
-            'q': query,
-            'gl': country_code,  # Country for search results
-            'hl': 'en',  # Language
-            'num': num_results,
-            'no_cache': 'true'
-        }
-        
-        # Add time filter if specified
-        if time_filter:
-            params['tbs'] = f'qdr:{time_filter}'
-        
-        logger.info(f"SerpAPI search: {query} (country: {country_code}, time: {time_filter})")
-        
-        response = requests.get(SERPAPI_URL, params=params, timeout=30)
-        response.raise_for_status()
-        
-        data = response.json()
-        
-        if 'error' in data:
-            logger.error(f"SerpAPI error: {data['error']}")
-            return []
-        
-        organic_results = data.get('organic_results', [])
+        organic_results = fetch_serpapi_results(query, country_code, time_filter, num_results, start_delay)
         logger.info(f"SerpAPI returned {len(organic_results)} results for query: {query}")
         
+        scraped_at = datetime.now().strftime("%Y-%m-%d %H:%M")
         jobs = []
         for result in organic_results:
             try:
@@ -384,19 +654,32 @@ def search_jobs_with_serpapi(query, country, time_filter="d", num_results=20):
                     continue
                 
                 # Enhanced job filtering
-                if is_job_related(title, link, snippet):
+                # Lowercase once; the filter and the stored job share these
+                title_lower = title.lower()
+                snippet_lower = snippet.lower()
+                if is_job_related(title_lower, link, snippet_lower):
                     source = determine_job_source(link)
                     
                     jobs.append({
                         'title': title,
                         'link': link,
                         'snippet': snippet,
+                        'title_lower': title_lower,
+                        'snippet_lower': snippet_lower,
+                        'snippet_preview': (
+                            snippet[:SNIPPET_PREVIEW_CHARS] + "..."
+                            if len(snippet) > SNIPPET_PREVIEW_CHARS else snippet
+                        ),
                         'source': source,
-                        'scraped_at': datetime.now().strftime("%Y-%m-%d %H:%M"),
+                        'scraped_at': scraped_at,
                         'query': query,
                         'country': country,
                         'serpapi_position': result.get('position', 0)
                     })
+                    
+                    # Stop once we have as many job results as were requested
+                    if len(jobs) >= num_results:
+                        break
             except Exception as e:
                 logger.warning(f"Error processing SerpAPI result: {e}")
                 continue
@@ -410,59 +693,25 @@ def search_jobs_with_serpapi(query, country, time_filter="d", num_results=20):
         logger.error(f"SerpAPI search error: {e}")
         return []
 
-def is_job_related(title, link, snippet):
-    """Determine if a search result is job-related."""
-    title_lower = title.lower()
+def is_job_related(title_lower, link, snippet_lower):
+    """Determine if a search result is job-related from its lowercased title and snippet."""
     link_lower = link.lower()
-    snippet_lower = snippet.lower()
-    
-    # Job site indicators
-    job_sites = [
-        'linkedin.com/jobs', 'indeed.', 'glassdoor.', 'monster.',
-        'greenhouse.io', 'lever.co', 'workday.', 'bamboohr.',
-        'smartrecruiters.', 'jobvite.', '/careers', '/jobs'
-    ]
-    
-    # Job content indicators
-    job_indicators = [
-        'job', 'career', 'position', 'hiring', 'vacancy', 
-        'employment', 'opportunity', 'apply', 'recruit', 'opening'
-    ]
-    
-    # Check if it's from a job site
-    is_job_site = any(site in link_lower for site in job_sites)
-    
-    # Check if it has job-related content
-    has_job_content = any(indicator in title_lower for indicator in job_indicators)
-    has_job_snippet = any(indicator in snippet_lower for indicator in job_indicators[:5])
     
     # Exclude obvious non-job content
-    exclude_terms = ['wikipedia', 'linkedin.com/in/', 'facebook.com', 'twitter.com', 'youtube.com']
-    is_excluded = any(term in link_lower for term in exclude_terms)
+    if JOB_EXCLUDE_RE.search(link_lower):
+        return False
     
-    return (is_job_site or has_job_content or has_job_snippet) and not is_excluded
+    return bool(
+        JOB_SITE_RE.search(link_lower)
+        or JOB_INDICATOR_RE.search(title_lower)
+        or JOB_SNIPPET_INDICATOR_RE.search(snippet_lower)
+    )
 
 def determine_job_source(link):
     """Determine the job source from URL."""
     link_lower = link.lower()
     
-    source_mapping = {
-        'linkedin.com/jobs': 'LinkedIn',
-        'indeed.': 'Indeed',
-        'glassdoor.': 'Glassdoor',
-        'monster.': 'Monster',
-        'greenhouse.io': 'Greenhouse',
-        'lever.co': 'Lever',
-        'workday.': 'Workday',
-        'bamboohr.': 'BambooHR',
-        'smartrecruiters.': 'SmartRecruiters',
-        'jobvite.': 'Jobvite',
-        'greenhouse.': 'Greenhouse',
-        '/careers': 'Company Career Page',
-        '/jobs': 'Company Jobs Page'
-    }
-    
-    for indicator, source_name in source_mapping.items():
+    for indicator, source_name in JOB_SOURCE_INDICATORS:
         if indicator in link_lower:
             return source_name
     
@@ -482,26 +731,47 @@ def run_serpapi_job_search(job_title, country, city="", industry=None, time_dura
     st.info(f"🔍 Searching with {len(queries)} optimized queries via SerpAPI...")
     
     all_jobs = []
+    seen_links = set()
     progress_bar = st.progress(0)
     status_text = st.empty()
     
-    for i, query in enumerate(queries):
-        progress = (i + 1) / len(queries)
-        progress_bar.progress(progress)
-        status_text.text(f"Searching: {query[:70]}...")
-        
-        try:
-            jobs = search_jobs_with_serpapi(query, country, time_filter)
-            if jobs:
-                all_jobs.extend(jobs)
-                logger.info(f"Query {i+1}: Found {len(jobs)} jobs")
-            
-            # Brief pause to respect rate limits
-            time.sleep(0.5)
+    # Queries run concurrently; results are merged in query order afterwards
+    # so deduplication and tie-breaking stay deterministic
+    results = [None] * len(queries)
+    with ThreadPoolExecutor(max_workers=SERPAPI_MAX_WORKERS) as executor:
+        futures = {
+            executor.submit(
+                search_jobs_with_serpapi, query, country, time_filter,
+                start_delay=SERPAPI_STAGGER_SECONDS * i if i < SERPAPI_MAX_WORKERS else 0
+            ): i
+            for i, query in enumerate(queries)
+        }
+        last_update = 0.0
+        for completed, future in enumerate(as_completed(futures), start=1):
+            i = futures[future]
+            # Throttle widget updates; cached queries can complete in a burst
+            now = time.monotonic()
+            if now - last_update >= PROGRESS_UPDATE_INTERVAL_SECONDS or completed == len(queries):
+                progress_bar.progress(completed / len(queries))
+                status_text.text(f"Searched: {queries[i][:70]}...")
+                last_update = now
             
-        except Exception as e:
-            logger.warning(f"Query {i+1} failed: {e}")
+            try:
+                results[i] = future.result()
+            except Exception as e:
+                logger.warning(f"Query {i+1} failed: {e}")
+    
+    for i, jobs in enumerate(results):
+        if not jobs:
             continue
+        new_jobs = []
+        for job in jobs:
+            link_key = normalize_job_link(job['link'])
+            if link_key not in seen_links:
+                seen_links.add(link_key)
+                new_jobs.append(job)
+        all_jobs.extend(new_jobs)
+        logger.info(f"Query {i+1}: Found {len(jobs)} jobs ({len(new_jobs)} new)")
     
     progress_bar.empty()
     status_text.empty()
@@ -514,13 +784,54 @@ def run_serpapi_job_search(job_title, country, city="", industry=None, time_dura
     
     return sorted_jobs
 
+def normalize_job_link(link):
+    """Reduce a job URL to a key that ignores scheme, host case, www. and trailing slashes."""
+    parsed = urlparse(link.strip())
+    netloc = parsed.netloc.lower()
+    if netloc.startswith('www.'):
+        netloc = netloc[4:]
+    # The key string itself is the set key; Python's str hash is all we need
+    return f"{netloc}{parsed.path.rstrip('/')}?{parsed.query}"
+
+def normalize_search_text(text):
+    """Canonicalize free-text search input, ignoring only case and whitespace differences."""
+    return " ".join((text or "").lower().split())
+
+def make_search_cache_key(job_title, country, city="", industry=None, time_duration="Past 24 hours"):
+    """Build a cache key for a job search from its normalized inputs."""
+    return (
+        normalize_search_text(job_title),
+        country,
+        normalize_search_text(city),
+        industry or "",
+        time_duration
+    )
+
+class _NonWordDeleteTable(dict):
+    """str.translate table that deletes non-word, non-space characters, filled lazily."""
+    
+    def __missing__(self, codepoint):
+        char = chr(codepoint)
+        keep = char.isalnum() or char == '_' or char.isspace()
+        value = codepoint if keep else None
+        self[codepoint] = value
+        return value
+
+NON_WORD_DELETE_TABLE = _NonWordDeleteTable()
+
+# Preferred source when the same listing is found more than once
+SOURCE_DEDUP_PRIORITY = {
+    'Greenhouse': 9, 'Lever': 8, 'LinkedIn': 7, 'Company Career Page': 6,
+    'Indeed': 5, 'Glassdoor': 4, 'Monster': 3, 'Workday': 8
+}
+
 def deduplicate_jobs(jobs):
     """Remove duplicate job listings."""
     unique_jobs = {}
     
     for job in jobs:
-        # Create hash based on title and company
-        title_clean = re.sub(r'[^\w\s]', '', job['title'].lower()).strip()
+        # Create key based on title and company
+        title_clean = job['title_lower'].translate(NON_WORD_DELETE_TABLE).strip()
         
         # Extract company name
         company_name = ""
@@ -529,78 +840,148 @@ def deduplicate_jobs(jobs):
         elif " - " in job['title']:
             company_name = job['title'].split(" - ")[-1].strip().lower()
         
-        hash_string = f"{title_clean[:50]}{company_name[:30]}{job['source'].lower()}"
-        job_hash = hashlib.md5(hash_string.encode()).hexdigest()
+        # The key string itself is the dict key; Python's str hash is all we need
+        job_key = f"{title_clean[:50]}{company_name[:30]}{job['source'].lower()}"
         
-        if job_hash not in unique_jobs:
-            unique_jobs[job_hash] = job
+        if job_key not in unique_jobs:
+            unique_jobs[job_key] = job
         else:
             # Keep job with better source priority
-            source_priority = {
-                'Greenhouse': 9, 'Lever': 8, 'LinkedIn': 7, 'Company Career Page': 6,
-                'Indeed': 5, 'Glassdoor': 4, 'Monster': 3, 'Workday': 8
-            }
-            
-            existing_priority = source_priority.get(unique_jobs[job_hash]['source'], 1)
-            new_priority = source_priority.get(job['source'], 1)
+            existing_priority = SOURCE_DEDUP_PRIORITY.get(unique_jobs[job_key]['source'], 1)
+            new_priority = SOURCE_DEDUP_PRIORITY.get(job['source'], 1)
             
             if new_priority > existing_priority:
-                unique_jobs[job_hash] = job
+                unique_jobs[job_key] = job
     
     return list(unique_jobs.values())
 
+# Relevance weight for each job source
+SOURCE_RELEVANCE_SCORES = {
+    'Greenhouse': 15, 'Lever': 12, 'LinkedIn': 10, 'Company Career Page': 8,
+    'Indeed': 6, 'Glassdoor': 4, 'Workday': 12
+}
+
 def sort_jobs_by_relevance(jobs, job_title, industry=None):
     """Sort jobs by relevance score."""
-    def calculate_score(job):
+    if not jobs:
+        return []
+    
+    job_title_lower = job_title.lower()
+    job_words = [word for word in job_title_lower.split() if len(word) > 2]
+    
+    def text_score(job):
         score = 0
-        title_lower = job['title'].lower()
-        job_title_lower = job_title.lower()
-        snippet_lower = job['snippet'].lower()
+        title_lower = job['title_lower']
+        snippet_lower = job['snippet_lower']
         
         # Exact title match
         if job_title_lower in title_lower:
             score += 30
         
         # Word matching
-        job_words = job_title_lower.split()
         for word in job_words:
-            if len(word) > 2:
-                if word in title_lower:
-                    score += 10
-                elif word in snippet_lower:
-                    score += 5
-        
-        # Source quality
-        source_scores = {
-            'Greenhouse': 15, 'Lever': 12, 'LinkedIn': 10, 'Company Career Page': 8,
-            'Indeed': 6, 'Glassdoor': 4, 'Workday': 12
-        }
-        score += source_scores.get(job['source'], 2)
-        
-        # SerpAPI position bonus (higher positions are better)
-        position = job.get('serpapi_position', 10)
-        score += max(0, 20 - position)
+            if word in title_lower:
+                score += 10
+            elif word in snippet_lower:
+                score += 5
         
         return score
     
-    return sorted(jobs, key=calculate_score, reverse=True)
-
-# --- Resume Analysis Functions ---
-def parse_resume_with_ai(resume_text, selected_industry=None):
-    """Parse resume using AI with improved error handling and fallbacks."""
-    industry_context = ""
-    if selected_industry:
-        domains = INDUSTRIES.get(selected_industry, {}).get('domains', [])
-        industry_context = f"Industry Focus: {selected_industry}\nRelevant Domains: {', '.join(domains[:5])}"
+    count = len(jobs)
+    text_scores = np.fromiter((text_score(job) for job in jobs), dtype=np.int32, count=count)
     
-    # Create a more explicit prompt that discourages thinking tags
-    prompt = f"""
-    Extract information from this resume and format it as a JSON object. Do not include any explanations, thinking process, or additional text - return ONLY the JSON object.
+    # Source quality
+    source_scores = np.fromiter(
+        (SOURCE_RELEVANCE_SCORES.get(job['source'], 2) for job in jobs), dtype=np.int32, count=count
+    )
     
-    {industry_context}
+    # SerpAPI position bonus (higher positions are better)
+    positions = np.fromiter((job.get('serpapi_position', 10) for job in jobs), dtype=np.int32, count=count)
+    position_bonus = np.maximum(0, 20 - positions)
     
-    JSON Format Required (copy this structure exactly):
-    {{
+    scores = text_scores + source_scores + position_bonus
+    order = np.argsort(-scores, kind='stable')
+    return [jobs[i] for i in order]
+
+# --- Resume Analysis Functions ---
+# Successful resume parses and insights are memoized in memory, bounded in size and age;
+# failures raise inside the cached helpers so a fallback result is never stored
+RESUME_CACHE_MAX_ENTRIES = 100
+RESUME_CACHE_TTL_SECONDS = 3600
+
+# Resume characters sent to the model, counted after whitespace is compacted
+RESUME_PROMPT_CHARS = 2500
+
+# Runs of spaces/tabs, and line breaks with any surrounding blank space
+HORIZONTAL_SPACE_RE = re.compile(r'[^\S\n]+')
+LINE_BREAK_RUN_RE = re.compile(r'\s*\n\s*')
+
+def compact_resume_text(resume_text, limit=RESUME_PROMPT_CHARS):
+    """Collapse whitespace runs and cut the resume at a word boundary within the prompt budget."""
+    text = HORIZONTAL_SPACE_RE.sub(' ', resume_text)
+    text = LINE_BREAK_RUN_RE.sub('\n', text).strip()
+    if len(text) <= limit:
+        return text
+    
+    # Back up to the last whitespace so no word is cut in half
+    cut = max(text.rfind(' ', 0, limit + 1), text.rfind('\n', 0, limit + 1))
+    return text[:cut if cut > limit // 2 else limit]
+
+# Static system prompts are kept identical across calls so the provider can
+# reuse the cached prompt prefix; only the user message varies per resume.
+RESUME_PARSE_SYSTEM_PROMPT = """You are a JSON data extractor. Return only valid JSON objects with no additional text, explanations, or thinking process.
+
+Extract information from the resume in the user message and format it as a JSON object. Do not include any explanations, thinking process, or additional text - return ONLY the JSON object.
+
+JSON Format Required (copy this structure exactly):
+{
+    "name": "Full Name Here",
+    "email": "email@domain.com",
+    "phone": "phone number",
+    "location": "city, state/country",
+    "summary": "Brief professional summary",
+    "skills": ["skill1", "skill2", "skill3"],
+    "technical_skills": ["tech1", "tech2"],
+    "experience": [
+        {
+            "title": "Job Title",
+            "company": "Company Name",
+            "duration": "Start - End dates",
+            "achievements": ["achievement1", "achievement2"]
+        }
+    ],
+    "education": [
+        {
+            "degree": "Degree Name",
+            "institution": "School Name",
+            "year": "Graduation Year"
+        }
+    ],
+    "certifications": ["cert1", "cert2"],
+    "industry_alignment": 75
+}"""
+
+RESUME_INSIGHTS_SYSTEM_PROMPT = """You are a JSON generator for resume analysis. Output only valid JSON with no explanations.
+
+Analyze the resume described in the user message and return insights as JSON. No explanations or thinking process - only JSON output.
+
+Return this exact JSON structure:
+{
+    "ats_score": 75,
+    "overall_score": 80,
+    "strengths": ["strength1", "strength2", "strength3"],
+    "improvements": ["improvement1", "improvement2"],
+    "missing_keywords": ["keyword1", "keyword2"],
+    "recommendations": ["rec1", "rec2", "rec3"]
+}"""
+
+RESUME_ANALYSIS_SYSTEM_PROMPT = """You are a JSON generator for resume parsing and analysis. Return only valid JSON objects with no additional text, explanations, or thinking process.
+
+Extract information from the resume in the user message and analyze it. Return ONE JSON object with exactly two top-level keys: "parsed" for the extracted resume data and "insights" for the analysis.
+
+JSON Format Required (copy this structure exactly):
+{
+    "parsed": {
         "name": "Full Name Here",
         "email": "email@domain.com",
         "phone": "phone number",
@@ -609,26 +990,134 @@ def parse_resume_with_ai(resume_text, selected_industry=None):
         "skills": ["skill1", "skill2", "skill3"],
         "technical_skills": ["tech1", "tech2"],
         "experience": [
-            {{
+            {
                 "title": "Job Title",
                 "company": "Company Name",
                 "duration": "Start - End dates",
                 "achievements": ["achievement1", "achievement2"]
-            }}
+            }
         ],
         "education": [
-            {{
+            {
                 "degree": "Degree Name",
                 "institution": "School Name",
                 "year": "Graduation Year"
-            }}
+            }
         ],
         "certifications": ["cert1", "cert2"],
         "industry_alignment": 75
-    }}
+    },
+    "insights": {
+        "ats_score": 75,
+        "overall_score": 80,
+        "strengths": ["strength1", "strength2", "strength3"],
+        "improvements": ["improvement1", "improvement2"],
+        "missing_keywords": ["keyword1", "keyword2"],
+        "recommendations": ["rec1", "rec2", "rec3"]
+    }
+}"""
+
+def parse_and_analyze_resume(resume_text, selected_industry=None):
+    """Parse a resume and generate insights in one AI call, falling back to separate calls."""
+    try:
+        resume_data, insights = _cached_resume_analysis(resume_text, selected_industry)
+    except RuntimeError:
+        logger.warning("Failed to parse combined resume analysis, falling back to separate calls")
+        resume_data = parse_resume_with_ai(resume_text, selected_industry)
+        insights = None
+    
+    if insights is None and resume_data and resume_data.get('name') != 'Could not extract':
+        insights = generate_resume_insights(resume_data, selected_industry)
+    return resume_data, insights
+
+@st.cache_data(show_spinner=False, ttl=RESUME_CACHE_TTL_SECONDS, max_entries=RESUME_CACHE_MAX_ENTRIES)
+def _cached_resume_analysis(resume_text, selected_industry=None):
+    """Memoize a successful combined parse; insights are None when that part was invalid."""
+    industry_context = ""
+    if selected_industry in INDUSTRIES:
+        industry = INDUSTRIES[selected_industry]
+        industry_context = (
+            f"Industry Focus: {selected_industry}\n"
+            f"Relevant Domains: {industry.domains_prompt}\n"
+            f"Key Keywords: {industry.keywords_prompt}"
+        )
+    
+    prompt = f"""
+    {industry_context}
     
     Resume Text:
-    {resume_text[:2500]}
+    {compact_resume_text(resume_text)}
+    
+    IMPORTANT: Return ONLY the JSON object. No thinking, no explanations, no markdown - just pure JSON starting with {{ and ending with }}.
+    """
+    
+    try:
+        headers = {
+            "Authorization": f"Bearer {EURI_API_KEY}",
+            "Content-Type": "application/json"
+        }
+        
+        payload = {
+            "model": "deepseek-r1-distill-llama-70b",
+            "messages": [
+                {
+                    "role": "system", 
+                    "content": RESUME_ANALYSIS_SYSTEM_PROMPT
+                },
+                {
+                    "role": "user", 
+                    "content": prompt
+                }
+            ],
+            "max_tokens": 1500,  # Room for both the parsed data and the insights
+            "temperature": 0.1,
+            "stop": ["<think>", "</think>", "```"]
+        }
+        
+        response = get_http_session().post(EURI_API_URL, headers=headers, data=orjson.dumps(payload), timeout=(HTTP_CONNECT_TIMEOUT_SECONDS, 90))
+        response.raise_for_status()
+        result = orjson.loads(response.content)
+        ai_response = result['choices'][0]['message']['content']
+        
+        logger.info(f"Combined analysis AI Response (first 100 chars): {ai_response[:100]}...")
+        
+        parsed = extract_json_from_response(ai_response)
+        if isinstance(parsed, dict) and validate_resume_data(parsed.get('parsed')):
+            insights = parsed.get('insights')
+            if not validate_insights_data(insights):
+                logger.warning("Combined response had invalid insights, requesting them separately")
+                insights = None
+            return parsed['parsed'], insights
+        
+    except Exception as e:
+        logger.error(f"Combined resume analysis failed: {e}")
+    
+    raise RuntimeError("Combined resume analysis failed")
+
+def parse_resume_with_ai(resume_text, selected_industry=None):
+    """Parse resume using AI with improved error handling and fallbacks."""
+    try:
+        return _cached_resume_parse(resume_text, selected_industry)
+    except RuntimeError:
+        # Fallback: Basic text extraction
+        logger.warning("AI parsing failed completely, using fallback extraction")
+        return extract_resume_fallback(resume_text, selected_industry)
+
+@st.cache_data(show_spinner=False, ttl=RESUME_CACHE_TTL_SECONDS, max_entries=RESUME_CACHE_MAX_ENTRIES)
+def _cached_resume_parse(resume_text, selected_industry=None):
+    """Memoize a successful AI resume parse; failures raise so they aren't cached."""
+    industry_context = ""
+    if selected_industry:
+        domains = INDUSTRIES[selected_industry].domains_prompt if selected_industry in INDUSTRIES else ""
+        industry_context = f"Industry Focus: {selected_industry}\nRelevant Domains: {domains}"
+    
+    # Only the resume-specific part goes in the user message; the static
+    # instructions and schema live in the system prompt so the prefix is stable
+    prompt = f"""
+    {industry_context}
+    
+    Resume Text:
+    {compact_resume_text(resume_text)}
     
     IMPORTANT: Return ONLY the JSON object. No thinking, no explanations, no markdown - just pure JSON starting with {{ and ending with }}.
     """
@@ -647,7 +1136,7 @@ def parse_resume_with_ai(resume_text, selected_industry=None):
                 "messages": [
                     {
                         "role": "system", 
-                        "content": "You are a JSON data extractor. Return only valid JSON objects with no additional text, explanations, or thinking process."
+                        "content": RESUME_PARSE_SYSTEM_PROMPT
                     },
                     {
                         "role": "user", 
@@ -659,9 +1148,9 @@ def parse_resume_with_ai(resume_text, selected_industry=None):
                 "stop": ["<think>", "</think>", "```"]  # Stop sequences to prevent thinking
             }
             
-            response = requests.post(EURI_API_URL, headers=headers, json=payload, timeout=60)
+            response = get_http_session().post(EURI_API_URL, headers=headers, data=orjson.dumps(payload), timeout=(HTTP_CONNECT_TIMEOUT_SECONDS, 60))
             response.raise_for_status()
-            result = response.json()
+            result = orjson.loads(response.content)
             ai_response = result['choices'][0]['message']['content']
             
             # Log the raw response for debugging
@@ -683,9 +1172,7 @@ def parse_resume_with_ai(resume_text, selected_industry=None):
         except Exception as e:
             logger.error(f"Resume parsing attempt {attempt + 1} failed: {e}")
     
-    # Fallback: Basic text extraction
-    logger.warning("AI parsing failed completely, using fallback extraction")
-    return extract_resume_fallback(resume_text, selected_industry)
+    raise RuntimeError("AI resume parsing failed")
 
 def validate_resume_data(data):
     """Validate that parsed resume data has required fields."""
@@ -708,6 +1195,12 @@ def validate_resume_data(data):
     
     return True
 
+# Contact patterns and skill terms used when the AI parse is unavailable
+FALLBACK_EMAIL_RE = re.compile(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b')
+FALLBACK_PHONE_RE = re.compile(r'(\+?1[-.\s]?)?\(?([0-9]{3})\)?[-.\s]?([0-9]{3})[-.\s]?([0-9]{4})')
+FALLBACK_SKILL_KEYWORDS = ('python', 'java', 'javascript', 'sql', 'excel', 'powerbi', 'tableau',
+                           'project management', 'data analysis', 'machine learning', 'aws', 'azure')
+
 def extract_resume_fallback(resume_text, selected_industry=None):
     """Fallback resume extraction using basic text processing."""
     logger.info("Using fallback resume extraction")
@@ -721,14 +1214,12 @@ def extract_resume_fallback(resume_text, selected_industry=None):
     location = "Location not found"
     
     # Look for email
-    email_pattern = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
-    email_match = re.search(email_pattern, resume_text)
+    email_match = FALLBACK_EMAIL_RE.search(resume_text)
     if email_match:
         email = email_match.group()
     
     # Look for phone
-    phone_pattern = r'(\+?1[-.\s]?)?\(?([0-9]{3})\)?[-.\s]?([0-9]{3})[-.\s]?([0-9]{4})'
-    phone_match = re.search(phone_pattern, resume_text)
+    phone_match = FALLBACK_PHONE_RE.search(resume_text)
     if phone_match:
         phone = phone_match.group()
     
@@ -740,12 +1231,10 @@ def extract_resume_fallback(resume_text, selected_industry=None):
             break
     
     # Basic skills extraction
-    skills_keywords = ['python', 'java', 'javascript', 'sql', 'excel', 'powerbi', 'tableau', 
-                      'project management', 'data analysis', 'machine learning', 'aws', 'azure']
     found_skills = []
     resume_lower = resume_text.lower()
     
-    for skill in skills_keywords:
+    for skill in FALLBACK_SKILL_KEYWORDS:
         if skill in resume_lower:
             found_skills.append(skill.title())
     
@@ -765,15 +1254,21 @@ def extract_resume_fallback(resume_text, selected_industry=None):
 
 def generate_resume_insights(resume_data, selected_industry=None):
     """Generate resume insights using AI with improved error handling."""
+    try:
+        return _cached_resume_insights(resume_data, selected_industry)
+    except RuntimeError:
+        return generate_fallback_insights(resume_data, selected_industry)
+
+@st.cache_data(show_spinner=False, ttl=RESUME_CACHE_TTL_SECONDS, max_entries=RESUME_CACHE_MAX_ENTRIES)
+def _cached_resume_insights(resume_data, selected_industry=None):
+    """Memoize successful AI insights; failures raise so they aren't cached."""
     industry_context = ""
     if selected_industry:
-        keywords = INDUSTRIES.get(selected_industry, {}).get('keywords', [])
-        industry_context = f"Target Industry: {selected_industry}\nKey Keywords: {', '.join(keywords[:8])}"
+        keywords = INDUSTRIES[selected_industry].keywords_prompt if selected_industry in INDUSTRIES else ""
+        industry_context = f"Target Industry: {selected_industry}\nKey Keywords: {keywords}"
     
-    # Create a simpler prompt that avoids thinking responses
+    # Static instructions live in the system prompt; only the summary varies
     prompt = f"""
-    Analyze this resume and return insights as JSON. No explanations or thinking process - only JSON output.
-    
     {industry_context}
     
     Resume Summary:
@@ -782,16 +1277,6 @@ def generate_resume_insights(resume_data, selected_industry=None):
     - Experience: {len(resume_data.get('experience', []))} positions
     - Education: {len(resume_data.get('education', []))} entries
     
-    Return this exact JSON structure:
-    {{
-        "ats_score": 75,
-        "overall_score": 80,
-        "strengths": ["strength1", "strength2", "strength3"],
-        "improvements": ["improvement1", "improvement2"],
-        "missing_keywords": ["keyword1", "keyword2"],
-        "recommendations": ["rec1", "rec2", "rec3"]
-    }}
-    
     JSON output only - no additional text.
     """
     
@@ -807,7 +1292,7 @@ def generate_resume_insights(resume_data, selected_industry=None):
             "messages": [
                 {
                     "role": "system", 
-                    "content": "You are a JSON generator for resume analysis. Output only valid JSON with no explanations."
+                    "content": RESUME_INSIGHTS_SYSTEM_PROMPT
                 },
                 {
                     "role": "user", 
@@ -819,9 +1304,9 @@ def generate_resume_insights(resume_data, selected_industry=None):
             "stop": ["<think>", "</think>", "```", "\n\n"]
         }
         
-        response = requests.post(EURI_API_URL, headers=headers, json=payload, timeout=60)
+        response = get_http_session().post(EURI_API_URL, headers=headers, data=orjson.dumps(payload), timeout=(HTTP_CONNECT_TIMEOUT_SECONDS, 60))
         response.raise_for_status()
-        result = response.json()
+        result = orjson.loads(response.content)
         ai_response = result['choices'][0]['message']['content']
         
         logger.info(f"Insights AI Response (first 100 chars): {ai_response[:100]}...")
@@ -833,12 +1318,10 @@ def generate_resume_insights(resume_data, selected_industry=None):
         else:
             logger.warning("Failed to parse insights JSON, using fallback")
         
-        # Fallback insights
-        return generate_fallback_insights(resume_data, selected_industry)
-        
     except Exception as e:
         logger.error(f"Resume insights generation failed: {e}")
-        return generate_fallback_insights(resume_data, selected_industry)
+    
+    raise RuntimeError("Resume insights generation failed")
 
 def validate_insights_data(data):
     """Validate insights data structure."""
@@ -861,6 +1344,14 @@ def validate_insights_data(data):
     
     return True
 
+# Generic advice returned with every fallback insights result
+FALLBACK_RECOMMENDATIONS = (
+    "Quantify achievements with specific numbers and metrics",
+    "Use action verbs to start bullet points",
+    "Tailor resume keywords to job descriptions",
+    "Keep resume to 1-2 pages maximum"
+)
+
 def generate_fallback_insights(resume_data, selected_industry=None):
     """Generate basic insights as fallback."""
     skills_count = len(resume_data.get('skills', []))
@@ -889,18 +1380,15 @@ def generate_fallback_insights(resume_data, selected_industry=None):
     if not resume_data.get('certifications'):
         improvements.append("Consider adding relevant certifications")
     
-    recommendations = [
-        "Quantify achievements with specific numbers and metrics",
-        "Use action verbs to start bullet points",
-        "Tailor resume keywords to job descriptions",
-        "Keep resume to 1-2 pages maximum"
-    ]
-    
     missing_keywords = []
     if selected_industry and selected_industry in INDUSTRIES:
-        industry_keywords = INDUSTRIES[selected_industry]['keywords']
+        industry = INDUSTRIES[selected_industry]
         resume_text = str(resume_data).lower()
-        missing_keywords = [kw for kw in industry_keywords[:5] if kw not in resume_text]
+        present = set(industry.keyword_re.findall(resume_text))
+        missing_keywords = [
+            kw for kw in industry.keywords[:5]
+            if not any(kw in match for match in present)
+        ]
     
     return {
         "ats_score": ats_score,
@@ -908,12 +1396,28 @@ def generate_fallback_insights(resume_data, selected_industry=None):
         "strengths": strengths[:5],
         "improvements": improvements[:4],
         "missing_keywords": missing_keywords,
-        "recommendations": recommendations[:5]
+        "recommendations": list(FALLBACK_RECOMMENDATIONS)
     }
 
 # --- Chat Function ---
-def chat_about_career(user_message, resume_data=None):
-    """Handle career chat."""
+# Prior chat messages included in each prompt, and the characters kept from each,
+# so prompt size stays bounded however long the conversation runs
+CHAT_HISTORY_MESSAGES = 6
+CHAT_HISTORY_MESSAGE_CHARS = 500
+
+def stream_career_chat(user_message, resume_data=None, history=()):
+    """Stream a career chat reply, falling back to a regular call if streaming yields nothing."""
+    conversation = ""
+    if history:
+        recent = "\n".join(
+            f"{message['role'].title()}: {message['content'][:CHAT_HISTORY_MESSAGE_CHARS]}"
+            for message in history[-CHAT_HISTORY_MESSAGES:]
+        )
+        conversation = f"""
+        Recent Conversation:
+        {recent}
+        """
+    
     context = ""
     if resume_data:
         context = f"""
@@ -926,13 +1430,25 @@ def chat_about_career(user_message, resume_data=None):
     prompt = f"""
     You are a career advisor. Answer this question helpfully and concisely.
     {context}
+    {conversation}
     
     Question: {user_message}
     
     Provide practical, actionable advice in under 200 words.
     """
     
-    return call_euri_api(prompt)
+    streamed = False
+    try:
+        for text in stream_euri_completion(prompt):
+            streamed = True
+            yield text
+    except Exception as e:
+        logger.error(f"Streaming chat request failed: {e}")
+    
+    if not streamed:
+        response = call_euri_api(prompt)
+        if response:
+            yield response
 
 # --- UI Functions ---
 def main():
@@ -946,19 +1462,16 @@ def main():
     with col2:
         st.success("✅ EURI AI Connected")
     
-    # Navigation
+    # Navigation; each label maps straight to its page renderer
+    pages = {
+        "🌍 Job Search": render_job_search,
+        "📄 Resume Analyzer": render_resume_analyzer,
+        "💬 Career Chat": render_career_chat
+    }
     st.sidebar.title("🧭 Navigation")
-    page = st.sidebar.radio(
-        "Choose a feature:",
-        ["🌍 Job Search", "📄 Resume Analyzer", "💬 Career Chat"]
-    )
+    page = st.sidebar.radio("Choose a feature:", list(pages))
     
-    if page == "🌍 Job Search":
-        render_job_search()
-    elif page == "📄 Resume Analyzer":
-        render_resume_analyzer()
-    else:
-        render_career_chat()
+    pages[page]()
 
 def render_job_search():
     st.header("🌍 Global Job Search (SerpAPI)")
@@ -1034,37 +1547,85 @@ def render_job_search():
         
         with st.spinner("🔍 SerpAPI is searching for jobs..."):
             try:
-                jobs = run_serpapi_job_search(job_title, country, city, industry_param, time_duration)
+                cache_key = make_search_cache_key(job_title, country, city, industry_param, time_duration)
+                cached = st.session_state.search_cache.get(cache_key)
+                cache_age = time.time() - cached[0] if cached else None
+                
+                if cached is None or cache_age > SEARCH_CACHE_TTL_SECONDS:
+                    jobs = run_serpapi_job_search(job_title, country, city, industry_param, time_duration)
+                    now = time.time()
+                    # Drop expired searches so the per-session cache stays small
+                    st.session_state.search_cache = {
+                        key: entry for key, entry in st.session_state.search_cache.items()
+                        if now - entry[0] <= SEARCH_CACHE_TTL_SECONDS
+                    }
+                    st.session_state.search_cache[cache_key] = (now, jobs)
+                else:
+                    jobs = cached[1]
+                    st.info(f"⚡ Served from {max(1, round(cache_age / 60))}-min-old cache")
                 
                 st.session_state.scraped_jobs = jobs
                 
                 if jobs:
                     st.success(f"✅ Found {len(jobs)} job opportunities!")
                     
-                    # Quick analytics
+                    # Quick analytics: count jobs per source once, then bucket the few distinct sources
+                    source_counts = Counter(j.get('source', '').lower() for j in jobs)
                     col1, col2, col3, col4 = st.columns(4)
                     with col1:
-                        linkedin_jobs = len([j for j in jobs if 'linkedin' in j.get('source', '').lower()])
+                        linkedin_jobs = sum(n for source, n in source_counts.items() if 'linkedin' in source)
                         st.metric("LinkedIn", linkedin_jobs)
                     with col2:
-                        greenhouse_jobs = len([j for j in jobs if 'greenhouse' in j.get('source', '').lower()])
+                        greenhouse_jobs = sum(n for source, n in source_counts.items() if 'greenhouse' in source)
                         st.metric("Greenhouse", greenhouse_jobs)
                     with col3:
-                        company_jobs = len([j for j in jobs if 'company' in j.get('source', '').lower()])
+                        company_jobs = sum(n for source, n in source_counts.items() if 'company' in source)
                         st.metric("Company Sites", company_jobs)
                     with col4:
                         other_jobs = len(jobs) - linkedin_jobs - greenhouse_jobs - company_jobs
                         st.metric("Other Sources", other_jobs)
                     
-                    display_job_results(jobs)
-                    
                 else:
                     st.warning("⚠️ No jobs found. Try different search terms or expand the time range.")
                     
             except Exception as e:
                 st.error(f"❌ Search failed: {str(e)}")
                 logger.error(f"SerpAPI job search error: {e}")
+    
+    # Results stay visible across reruns so filters and pagination work
+    if st.session_state.scraped_jobs:
+        display_job_results(st.session_state.scraped_jobs)
+
+# Badge icon per job source; unknown sources get a globe
+SOURCE_ICONS = {
+    'LinkedIn': '💼', 'Indeed': '🔍', 'Glassdoor': '🏢',
+    'Greenhouse': '🌱', 'Lever': '⚡', 'Workday': '💻',
+    'Company Career Page': '🏛️', 'Company Jobs Page': '🏢'
+}
+
+@lru_cache(maxsize=512)
+def render_job_card_html(title, source, icon, position, scraped_at, country, matches=()):
+    """Build the static part of a job card as a single HTML block."""
+    matches_html = ""
+    if matches:
+        matches_html = f"<p>🎯 <em>Matches: {html.escape(', '.join(matches))}</em></p>"
+    
+    return (
+        f'<div class="job-card">'
+        f'<h3>{html.escape(title)}</h3>'
+        f'{matches_html}'
+        f'<p><span class="source-badge">{icon} {html.escape(source)}</span> '
+        f'<small>Position: #{html.escape(str(position))}</small></p>'
+        f'<small>🕒 Found: {html.escape(str(scraped_at))} · '
+        f'🌍 Country: {html.escape(str(country))} · 🔍 Via: SerpAPI</small>'
+        f'</div>'
+    )
 
+# Widget changes inside a fragment rerun only that fragment (st.fragment needs Streamlit
+# 1.37+, st.experimental_fragment 1.33+); older versions simply run the function inline
+fragment = getattr(st, "fragment", None) or getattr(st, "experimental_fragment", None) or (lambda func: func)
+
+@fragment
 def display_job_results(jobs):
     """Display job search results with filtering and export options."""
     if not jobs:
@@ -1073,11 +1634,14 @@ def display_job_results(jobs):
     st.markdown("---")
     st.subheader("📋 Job Results")
     
+    # Source options and sort orders, computed once per pass and shared with filter_jobs
+    projection = project_jobs(jobs)
+    
     # Filtering options
     col1, col2, col3 = st.columns(3)
     
     with col1:
-        sources = sorted(list(set([job['source'] for job in jobs])))
+        sources = projection['source_options']
         source_filter = st.multiselect(
             "Filter by Source",
             options=sources,
@@ -1099,63 +1663,59 @@ def display_job_results(jobs):
             key="sort_option"
         )
     
-    # Apply filters
-    filtered_jobs = jobs
-    
-    if source_filter:
-        filtered_jobs = [job for job in filtered_jobs if job['source'] in source_filter]
-    
-    if search_filter:
-        search_terms = search_filter.lower().split()
-        filtered_jobs = [
-            job for job in filtered_jobs 
-            if any(term in job['title'].lower() or term in job.get('snippet', '').lower() 
-                  for term in search_terms)
-        ]
-    
-    # Apply sorting
-    if sort_by == "Source":
-        filtered_jobs.sort(key=lambda x: x['source'])
-    elif sort_by == "Title A-Z":
-        filtered_jobs.sort(key=lambda x: x['title'])
+    # Apply filters and sorting
+    filtered_jobs = filter_jobs(jobs, source_filter, search_filter, sort_by, projection)
     
     if not filtered_jobs:
         st.warning("No jobs match your filters.")
         return
     
-    st.write(f"**Showing {len(filtered_jobs)} of {len(jobs)} jobs**")
+    # Pagination
+    total_pages = max(1, math.ceil(len(filtered_jobs) / JOBS_PER_PAGE))
+    page = 1
+    if total_pages > 1:
+        page = st.number_input(
+            "Page",
+            min_value=1,
+            max_value=total_pages,
+            value=1,
+            step=1,
+            key="job_results_page"
+        )
+    start = (page - 1) * JOBS_PER_PAGE
+    page_jobs = filtered_jobs[start:start + JOBS_PER_PAGE]
+    
+    st.write(
+        f"**Showing {start + 1}-{start + len(page_jobs)} of {len(filtered_jobs)} matching jobs "
+        f"({len(jobs)} total)**"
+    )
     
     # Display jobs
-    for i, job in enumerate(filtered_jobs[:50]):  # Limit to 50 for performance
+    search_terms = search_filter.lower().split() if search_filter else []
+    for job in page_jobs:
         with st.container():
-            if i > 0:
-                st.markdown("---")
+            # Highlight search matches
+            matches = tuple(term for term in search_terms if term in job['title_lower'])
             
-            # Job header
-            col1, col2, col3 = st.columns([4, 2, 1])
+            # Source with styling
+            icon = SOURCE_ICONS.get(job['source'], '🌐')
             
+            col1, col2 = st.columns([6, 1])
             with col1:
-                st.markdown(f"### {job['title']}")
-                
-                # Highlight search matches
-                if search_filter:
-                    title_lower = job['title'].lower()
-                    matches = [term for term in search_filter.lower().split() if term in title_lower]
-                    if matches:
-                        st.markdown(f"🎯 *Matches: {', '.join(matches)}*")
+                st.markdown(
+                    render_job_card_html(
+                        job['title'],
+                        job['source'],
+                        icon,
+                        job.get('serpapi_position', 'N/A'),
+                        job.get('scraped_at', 'Unknown'),
+                        job.get('country', 'Unknown'),
+                        matches
+                    ),
+                    unsafe_allow_html=True
+                )
             
             with col2:
-                # Source with styling
-                source_icons = {
-                    'LinkedIn': '💼', 'Indeed': '🔍', 'Glassdoor': '🏢',
-                    'Greenhouse': '🌱', 'Lever': '⚡', 'Workday': '💻',
-                    'Company Career Page': '🏛️', 'Company Jobs Page': '🏢'
-                }
-                icon = source_icons.get(job['source'], '🌐')
-                st.markdown(f"{icon} **{job['source']}**")
-                st.caption(f"Position: #{job.get('serpapi_position', 'N/A')}")
-            
-            with col3:
                 st.link_button(
                     "📄 Apply Now", 
                     job['link'], 
@@ -1166,19 +1726,7 @@ def display_job_results(jobs):
             # Job details
             if job.get('snippet'):
                 with st.expander("📖 Job Description", expanded=False):
-                    snippet = job['snippet']
-                    if len(snippet) > 600:
-                        snippet = snippet[:600] + "..."
-                    st.markdown(snippet)
-            
-            # Metadata
-            col1, col2, col3 = st.columns(3)
-            with col1:
-                st.caption(f"🕒 Found: {job.get('scraped_at', 'Unknown')}")
-            with col2:
-                st.caption(f"🌍 Country: {job.get('country', 'Unknown')}")
-            with col3:
-                st.caption(f"🔍 Via: SerpAPI")
+                    st.markdown(job['snippet_preview'])
     
     # Export and analytics
     if filtered_jobs:
@@ -1204,6 +1752,50 @@ def display_job_results(jobs):
                 links = "\n".join([f"{job['title']} - {job['link']}" for job in filtered_jobs])
                 st.text_area("Job Links (Copy All)", links, height=200)
 
+def project_jobs(jobs):
+    """Precompute the source options and sort orders for a job list."""
+    sources = np.array([job['source'] for job in jobs], dtype=object)
+    titles = np.array([job['title'] for job in jobs], dtype=object)
+    source_order = np.argsort(sources, kind='stable')
+    return {
+        # Unique sources fall out of the source sort order without a second sort
+        'source_options': list(dict.fromkeys(sources[source_order].tolist())),
+        'sort_orders': {
+            "Source": source_order,
+            "Title A-Z": np.argsort(titles, kind='stable')
+        }
+    }
+
+def filter_jobs_mask(jobs, source_filter=None, search_filter=""):
+    """Return a boolean mask of jobs matching the source and search filters."""
+    # Result lists are a few hundred jobs at most, so plain Python beats building a DataFrame
+    sources = frozenset(source_filter) if source_filter else None
+    search_terms = search_filter.lower().split() if search_filter else []
+    pattern = re.compile('|'.join(re.escape(term) for term in search_terms)) if search_terms else None
+    
+    mask = np.ones(len(jobs), dtype=bool)
+    for i, job in enumerate(jobs):
+        if sources is not None and job['source'] not in sources:
+            mask[i] = False
+        elif pattern and not (pattern.search(job.get('title_lower') or '')
+                              or pattern.search(job.get('snippet_lower') or '')):
+            mask[i] = False
+    
+    return mask
+
+def filter_jobs(jobs, source_filter=None, search_filter="", sort_by="Relevance", projection=None):
+    """Filter jobs by source and search terms, then apply a precomputed sort order."""
+    if not jobs:
+        return []
+    
+    if projection is None:
+        projection = project_jobs(jobs)
+    mask = filter_jobs_mask(jobs, source_filter, search_filter)
+    order = projection['sort_orders'].get(sort_by)
+    indices = order[mask[order]] if order is not None else np.flatnonzero(mask)
+    
+    return [jobs[i] for i in indices]
+
 def show_job_analytics(jobs):
     """Show analytics for job search results."""
     st.subheader("📈 Job Search Analytics")
@@ -1213,14 +1805,13 @@ def show_job_analytics(jobs):
     
     with col1:
         st.markdown("**Sources Distribution**")
-        source_counts = {}
-        for job in jobs:
-            source = job.get('source', 'Unknown')
-            source_counts[source] = source_counts.get(source, 0) + 1
-        
-        for source, count in sorted(source_counts.items(), key=lambda x: x[1], reverse=True):
-            percentage = (count / len(jobs)) * 100
-            st.write(f"• {source}: {count} jobs ({percentage:.1f}%)")
+        source_counts = Counter(job.get('source', 'Unknown') for job in jobs)
+
+        # One element for the whole list rather than one st.write per source
+        st.markdown("  \n".join(
+            f"• {source}: {count} jobs ({count / len(jobs) * 100:.1f}%)"
+            for source, count in source_counts.most_common()
+        ))
     
     with col2:
         st.markdown("**Search Performance**")
@@ -1236,25 +1827,24 @@ def show_job_analytics(jobs):
         avg_position = sum([job.get('serpapi_position', 10) for job in jobs]) / len(jobs)
         st.metric("Avg. Search Position", f"{avg_position:.1f}")
 
+CSV_EXPORT_FIELDS = ('title', 'source', 'link', 'snippet', 'country', 'scraped_at', 'serpapi_position')
+CSV_SNIPPET_COLUMN = CSV_EXPORT_FIELDS.index('snippet')
+
+# Flattens line breaks in snippets to spaces in one translate() call
+CSV_NEWLINE_TABLE = str.maketrans('\n\r', '  ')
+
+def _csv_row(job):
+    """Project a job onto the CSV export columns."""
+    row = [str(job.get(field, '')) for field in CSV_EXPORT_FIELDS]
+    row[CSV_SNIPPET_COLUMN] = row[CSV_SNIPPET_COLUMN].translate(CSV_NEWLINE_TABLE)
+    return row
+
 def export_jobs_to_csv(jobs):
-    """Export jobs to CSV format."""
-    import csv
-    import io
-    
+    """Export jobs to CSV format in a single streaming pass."""
     output = io.StringIO()
-    fieldnames = ['title', 'source', 'link', 'snippet', 'country', 'scraped_at', 'serpapi_position']
-    writer = csv.DictWriter(output, fieldnames=fieldnames)
-    writer.writeheader()
-    
-    for job in jobs:
-        row = {}
-        for field in fieldnames:
-            value = job.get(field, '')
-            if field == 'snippet' and value:
-                value = value.replace('\n', ' ').replace('\r', ' ')
-            row[field] = str(value)
-        writer.writerow(row)
-    
+    writer = csv.writer(output)
+    writer.writerow(CSV_EXPORT_FIELDS)
+    writer.writerows(_csv_row(job) for job in jobs)
     return output.getvalue()
 
 def render_resume_analyzer():
@@ -1272,10 +1862,10 @@ def render_resume_analyzer():
     
     with col2:
         if selected_industry != "None":
-            domains = INDUSTRIES[selected_industry]['domains']
+            domains = INDUSTRIES[selected_industry].domains
             selected_domain = st.selectbox(
                 "Domain",
-                ["Any"] + domains,
+                ["Any", *domains],
                 help="Specific domain within industry"
             )
     
@@ -1292,13 +1882,13 @@ def render_resume_analyzer():
             with st.spinner("🤖 Analyzing resume..."):
                 content = get_text_from_file(uploaded_file)
                 
-                if content and len(content.strip()) > 50:
+                # get_text_from_file already returns stripped text
+                if content and len(content) > 50:
                     industry_param = selected_industry if selected_industry != "None" else None
-                    resume_data = parse_resume_with_ai(content, industry_param)
+                    resume_data, insights = parse_and_analyze_resume(content, industry_param)
                     
                     if resume_data and resume_data.get('name') != 'Could not extract':
                         st.session_state.resume_data = resume_data
-                        insights = generate_resume_insights(resume_data, industry_param)
                         st.session_state.resume_insights = insights
                         st.success("✅ Resume analyzed!")
                     else:
@@ -1357,14 +1947,30 @@ def display_resume_analysis():
             keywords = insights.get('missing_keywords', [])
             if keywords:
                 st.markdown("**Missing Keywords:**")
-                keyword_cols = st.columns(3)
-                for i, keyword in enumerate(keywords[:9]):
-                    with keyword_cols[i % 3]:
-                        st.code(keyword)
+                st.markdown(" ".join(f"`{keyword}`" for keyword in keywords[:9]))
     
     # Raw data
     with st.expander("📄 Extracted Data"):
-        st.json(resume_data)
+        st.code(orjson.dumps(resume_data, option=orjson.OPT_INDENT_2).decode(), language="json")
+
+def clear_chat_messages():
+    """Reset the career chat history."""
+    st.session_state.chat_messages = []
+
+def ask_suggested_question(question):
+    """Queue a suggested question to be answered on the next script pass."""
+    st.session_state.suggested_question = question
+
+# (button label, question sent) pairs offered before the first chat message
+SUGGESTED_CHAT_QUESTIONS = (
+    ("How can I improve my resume?", "How can I improve my resume?"),
+    ("What salary should I expect?", "What salary should I expect for my role?"),
+    ("Interview tips for my background?", "What interview tips do you have for my background?"),
+    ("Skills I should learn?", "What skills should I learn to advance my career?")
+)
+
+# Chat messages re-rendered on each rerun, so long sessions don't slow the page
+CHAT_DISPLAY_MESSAGES = 40
 
 def render_career_chat():
     """Career chat interface."""
@@ -1382,59 +1988,128 @@ def render_career_chat():
     # Chat interface
     st.subheader("💭 Ask Your Career Questions")
     
-    # Display chat history
-    for message in st.session_state.chat_messages:
+    # Display the most recent chat history; older turns stay in session state
+    hidden_count = len(st.session_state.chat_messages) - CHAT_DISPLAY_MESSAGES
+    if hidden_count > 0:
+        st.caption(f"Showing the latest {CHAT_DISPLAY_MESSAGES} messages ({hidden_count} earlier hidden)")
+    for message in st.session_state.chat_messages[-CHAT_DISPLAY_MESSAGES:]:
         with st.chat_message(message["role"]):
             st.markdown(message["content"])
     
-    # Chat input
-    if prompt := st.chat_input("Ask about your career, resume, job search..."):
+    # Chat input; a clicked suggestion, queued by its callback, stands in for typed input
+    prompt = st.chat_input("Ask about your career, resume, job search...")
+    prompt = prompt or st.session_state.pop("suggested_question", None)
+    
+    if prompt:
         # Add user message
         st.session_state.chat_messages.append({"role": "user", "content": prompt})
         with st.chat_message("user"):
             st.markdown(prompt)
         
-        # Generate response
+        # Generate response, showing text as soon as the first tokens arrive
         with st.chat_message("assistant"):
-            with st.spinner("🤖 Thinking..."):
-                response = chat_about_career(prompt, st.session_state.resume_data)
+            reply_stream = stream_career_chat(
+                prompt,
+                st.session_state.resume_data,
+                st.session_state.chat_messages[:-1]  # Earlier turns; the new question is last
+            )
+            if hasattr(st, "write_stream"):
+                response = st.write_stream(reply_stream)
+            else:
+                # Streamlit < 1.31 has no write_stream; render the reply once complete
+                with st.spinner("🤖 Thinking..."):
+                    response = "".join(reply_stream)
                 if response:
                     st.markdown(response)
-                    st.session_state.chat_messages.append({"role": "assistant", "content": response})
-                else:
-                    error_msg = "Sorry, I'm having trouble connecting. Please try again."
-                    st.markdown(error_msg)
-                    st.session_state.chat_messages.append({"role": "assistant", "content": error_msg})
+            
+            if response:
+                st.session_state.chat_messages.append({"role": "assistant", "content": response})
+            else:
+                error_msg = "Sorry, I'm having trouble connecting. Please try again."
+                st.markdown(error_msg)
+                st.session_state.chat_messages.append({"role": "assistant", "content": error_msg})
     
-    # Suggested questions
+    # Suggested questions, checked after any new turn is recorded so they
+    # disappear on the same pass that answers one
     if not st.session_state.chat_messages:
         st.markdown("### 💭 Suggested Questions")
         
-        col1, col2 = st.columns(2)
-        
-        with col1:
-            if st.button("How can I improve my resume?", key="q1"):
-                st.session_state.chat_messages.append({"role": "user", "content": "How can I improve my resume?"})
-                st.rerun()
-            
-            if st.button("What salary should I expect?", key="q2"):
-                st.session_state.chat_messages.append({"role": "user", "content": "What salary should I expect for my role?"})
-                st.rerun()
-        
-        with col2:
-            if st.button("Interview tips for my background?", key="q3"):
-                st.session_state.chat_messages.append({"role": "user", "content": "What interview tips do you have for my background?"})
-                st.rerun()
-            
-            if st.button("Skills I should learn?", key="q4"):
-                st.session_state.chat_messages.append({"role": "user", "content": "What skills should I learn to advance my career?"})
-                st.rerun()
+        columns = st.columns(2)
+        for i, (label, question) in enumerate(SUGGESTED_CHAT_QUESTIONS):
+            with columns[i // 2]:
+                st.button(label, key=f"q{i + 1}", on_click=ask_suggested_question, args=(question,))
     
-    # Clear chat
+    # Clear chat; the callback runs before the next script pass, so no extra rerun is needed
     if st.session_state.chat_messages:
-        if st.button("🗑️ Clear Chat"):
-            st.session_state.chat_messages = []
-            st.rerun()
+        st.button("🗑️ Clear Chat", on_click=clear_chat_messages)
+
+# Custom CSS, built once at import and emitted as a single element per rerun
+CUSTOM_CSS = """
+<style>
+.stContainer > div {
+    padding-top: 1rem;
+}
+
+.job-card {
+    border: 1px solid #e0e0e0;
+    border-radius: 10px;
+    padding: 1.5rem;
+    margin: 1rem 0;
+    background: linear-gradient(135deg, #f8f9fa 0%, #ffffff 100%);
+    box-shadow: 0 2px 4px rgba(0,0,0,0.1);
+}
+
+.metric-card {
+    background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
+    color: white;
+    padding: 1rem;
+    border-radius: 8px;
+    text-align: center;
+    margin: 0.5rem 0;
+}
+
+.source-badge {
+    background: #e3f2fd;
+    color: #1976d2;
+    padding: 0.3rem 0.6rem;
+    border-radius: 15px;
+    font-size: 0.85rem;
+    font-weight: 500;
+}
+
+.success-metric {
+    background: linear-gradient(135deg, #4caf50 0%, #45a049 100%);
+    color: white;
+    padding: 0.8rem;
+    border-radius: 8px;
+    text-align: center;
+}
+
+.stProgress > div > div > div > div {
+    background: linear-gradient(90deg, #667eea 0%, #764ba2 100%);
+}
+
+.chat-message {
+    padding: 1rem;
+    margin: 0.5rem 0;
+    border-radius: 10px;
+    border-left: 4px solid #667eea;
+    background: #f8f9fa;
+}
+</style>
+"""
+
+def inject_custom_css():
+    """Inject the app's custom CSS."""
+    st.markdown(CUSTOM_CSS, unsafe_allow_html=True)
+
+# Static sidebar country list, rendered as a single markdown element
+SUPPORTED_COUNTRIES_MD = "\n\n".join(
+    f"🇺🇸 **{country}** ({info['code'].upper()})" for country, info in COUNTRIES.items()
+)
+
+# Source name fragments counted as premium in the session stats
+PREMIUM_SOURCE_TERMS = ('linkedin', 'greenhouse', 'lever')
 
 # Sidebar information
 def add_sidebar_info():
@@ -1451,8 +2126,7 @@ def add_sidebar_info():
     
     st.sidebar.markdown("---")
     st.sidebar.subheader("🌍 Supported Countries")
-    for country, info in COUNTRIES.items():
-        st.sidebar.write(f"🇺🇸 **{country}** ({info['code'].upper()})")
+    st.sidebar.markdown(SUPPORTED_COUNTRIES_MD)
     
     if st.session_state.scraped_jobs:
         st.sidebar.markdown("---")
@@ -1461,12 +2135,14 @@ def add_sidebar_info():
         jobs_count = len(st.session_state.scraped_jobs)
         st.sidebar.metric("Jobs Found", jobs_count)
         
-        sources = set([job['source'] for job in st.session_state.scraped_jobs])
-        st.sidebar.metric("Sources Used", len(sources))
+        # One pass over the jobs; the premium check then runs per distinct source
+        source_counts = Counter(job.get('source', '') for job in st.session_state.scraped_jobs)
+        st.sidebar.metric("Sources Used", len(source_counts))
         
-        premium_sources = len([j for j in st.session_state.scraped_jobs 
-                              if any(premium in j.get('source', '').lower() 
-                                   for premium in ['linkedin', 'greenhouse', 'lever'])])
+        premium_sources = sum(
+            count for source, count in source_counts.items()
+            if any(premium in source.lower() for premium in PREMIUM_SOURCE_TERMS)
+        )
         st.sidebar.metric("Premium Sources", premium_sources)
     
     st.sidebar.markdown("---")
@@ -1489,61 +2165,6 @@ def add_sidebar_info():
     """)
 
 if __name__ == "__main__":
-    # Custom CSS
-    st.markdown("""
-    <style>
-    .stContainer > div {
-        padding-top: 1rem;
-    }
-    
-    .job-card {
-        border: 1px solid #e0e0e0;
-        border-radius: 10px;
-        padding: 1.5rem;
-        margin: 1rem 0;
-        background: linear-gradient(135deg, #f8f9fa 0%, #ffffff 100%);
-        box-shadow: 0 2px 4px rgba(0,0,0,0.1);
-    }
-    
-    .metric-card {
-        background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-        color: white;
-        padding: 1rem;
-        border-radius: 8px;
-        text-align: center;
-        margin: 0.5rem 0;
-    }
-    
-    .source-badge {
-        background: #e3f2fd;
-        color: #1976d2;
-        padding: 0.3rem 0.6rem;
-        border-radius: 15px;
-        font-size: 0.85rem;
-        font-weight: 500;
-    }
-    
-    .success-metric {
-        background: linear-gradient(135deg, #4caf50 0%, #45a049 100%);
-        color: white;
-        padding: 0.8rem;
-        border-radius: 8px;
-        text-align: center;
-    }
-    
-    .stProgress > div > div > div > div {
-        background: linear-gradient(90deg, #667eea 0%, #764ba2 100%);
-    }
-    
-    .chat-message {
-        padding: 1rem;
-        margin: 0.5rem 0;
-        border-radius: 10px;
-        border-left: 4px solid #667eea;
-        background: #f8f9fa;
-    }
-    </style>
-    """, unsafe_allow_html=True)
-    
+    inject_custom_css()
     add_sidebar_info()
     main()
\ No newline at end of file
@@ -0,0 +1,64 @@
+"""Tests for DOCX text extraction in app.py."""
+import importlib.util
+import io
+from pathlib import Path
+
+import docx
+import pytest
+
+TESTS_DIR = Path(__file__).resolve().parent
+APP_PATH = TESTS_DIR.parent / "app.py"
+FIXTURES_DIR = TESTS_DIR / "fixtures"
+
+
+@pytest.fixture(scope="module")
+def app():
+    """Load app.py as a module; Streamlit calls run in bare mode."""
+    spec = importlib.util.spec_from_file_location("app", APP_PATH)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def test_text_box_is_emitted_once_and_separate_from_its_anchor(app):
+    # Word markup: the text box sits in a run of the "Data Analyst" paragraph and is
+    # stored twice, as DrawingML under mc:Choice and as VML under mc:Fallback
+    file_bytes = (FIXTURES_DIR / "resume_with_text_box.docx").read_bytes()
+
+    text = app.extract_docx_text(file_bytes)
+
+    assert text == (
+        "Jane Roe\n"
+        "Data Analyst\n"
+        "Skills: Python, SQL\n"
+        "Tools: Git & Docker\n"
+        "Experience\t2019 - 2024"
+    )
+
+
+def test_body_paragraphs_match_python_docx(app):
+    file_bytes = (FIXTURES_DIR / "resume_with_text_box.docx").read_bytes()
+    body_paragraphs = [
+        paragraph.text
+        for paragraph in docx.Document(io.BytesIO(file_bytes)).paragraphs
+        if paragraph.text.strip()
+    ]
+
+    lines = app.extract_docx_text(file_bytes).split("\n")
+
+    assert [line for line in lines if line in body_paragraphs] == body_paragraphs
+
+
+def test_tabs_and_line_breaks_inside_runs(app):
+    document = docx.Document()
+    paragraph = document.add_paragraph()
+    paragraph.add_run("Line one").add_break()
+    paragraph.add_run("Line two")
+    paragraph = document.add_paragraph("Name")
+    paragraph.add_run().add_tab()
+    paragraph.add_run("Value")
+    paragraph.paragraph_format.tab_stops.add_tab_stop(docx.shared.Inches(2))
+    buffer = io.BytesIO()
+    document.save(buffer)
+
+    assert app.extract_docx_text(buffer.getvalue()) == "Line one\nLine two\nName\tValue"